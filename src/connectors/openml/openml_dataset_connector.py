@@ -59,7 +59,7 @@ class OpenMlDatasetConnector(DatasetConnector):
             ],
             size=_as_int(qualities_json["NumberOfInstances"]),
             is_accessible_for_free=True,
-            keywords=set(dataset_json["tag"]),
+            keywords=dataset_json["tag"],
             license=dataset_json["licence"],
             version=dataset_json["version"],
         )
@@ -2,11 +2,12 @@
 Converting between different dataset representations
 """
 
-from typing import List, TypeVar, Type, Set
+import operator
+from typing import Any, Dict, Iterable, List, Set, Tuple, Type, TypeVar
 
 from fastapi import HTTPException
 from sqlalchemy import select
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload, selectinload
 
 from database.model.general import (
     OrmLicense,
@@ -15,53 +16,94 @@ from database.model.general import (
 from database.model.base import Base
 from database.model.publication import OrmPublication
 from database.model.dataset import OrmDataset, OrmDataDownload, OrmMeasuredValue, OrmAlternateName
-from schemas import AIoDDataset, AIoDDistribution, AIoDMeasurementValue
+from database.model.unique_model import UniqueMixin
+from schemas import AIoDDataset, AIoDDatasetOut
+
+# The fields that are copied as-is from the ORM to the AIoD representation. Their values are
+# retrieved at once using an attrgetter, instead of an attribute lookup per field.
+_SCALAR_FIELDS = (
+    "id",
+    "description",
+    "name",
+    "node",
+    "node_specific_identifier",
+    "same_as",
+    "creator",
+    "date_modified",
+    "date_published",
+    "funder",
+    "is_accessible_for_free",
+    "issn",
+    "size",
+    "spatial_coverage",
+    "temporal_coverage_from",
+    "temporal_coverage_to",
+    "version",
+)
+_get_scalar_fields = operator.attrgetter(*_SCALAR_FIELDS)
+_DISTRIBUTION_FIELDS = ("content_url", "content_size_kb", "description", "name", "encoding_format")
+_get_distribution_fields = operator.attrgetter(*_DISTRIBUTION_FIELDS)
+_MEASURED_VALUE_FIELDS = ("variable", "technique")
+_get_measured_value_fields = operator.attrgetter(*_MEASURED_VALUE_FIELDS)
+
+# Loader options for the relationships used by orm_to_aiod. Use them when querying multiple
+# datasets, to load each relationship for all datasets at once, instead of lazily per dataset.
+DATASET_LOAD_OPTIONS = (
+    joinedload(OrmDataset.license),
+    selectinload(OrmDataset.has_parts),
+    selectinload(OrmDataset.is_part),
+    selectinload(OrmDataset.alternate_names),
+    selectinload(OrmDataset.citations),
+    selectinload(OrmDataset.distributions),
+    selectinload(OrmDataset.keywords),
+    selectinload(OrmDataset.measured_values),
+)
 
 
-def orm_to_aiod(orm: OrmDataset) -> AIoDDataset:
+def orm_to_aiod(orm: OrmDataset) -> AIoDDatasetOut:
     """
     Converting between dataset representations: the database variant (OrmDataset) towards the
     AIoD schema.
+
+    The data originates from the database, so it is already type-correct. The AIoD object is
+    therefore created using `construct`, which skips the (costly) pydantic validation.
     """
-    return AIoDDataset(
-        id=orm.id,
-        description=orm.description,
-        name=orm.name,
-        node=orm.node,
-        node_specific_identifier=orm.node_specific_identifier,
-        same_as=orm.same_as,
-        creator=orm.creator,
-        date_modified=orm.date_modified,
-        date_published=orm.date_published,
-        funder=orm.funder,
-        is_accessible_for_free=orm.is_accessible_for_free,
-        issn=orm.issn,
-        size=orm.size,
-        spatial_coverage=orm.spatial_coverage,
-        temporal_coverage_from=orm.temporal_coverage_from,
-        temporal_coverage_to=orm.temporal_coverage_to,
-        version=orm.version,
-        license=orm.license.name if orm.license is not None else None,
-        has_parts=[part.id for part in orm.has_parts],
-        is_part=[part.id for part in orm.is_part],
-        alternate_names=[alias.name for alias in orm.alternate_names],
-        citations=[citation.id for citation in orm.citations],
-        distributions=[
-            AIoDDistribution(
-                content_url=orm_distr.content_url,
-                content_size_kb=orm_distr.content_size_kb,
-                description=orm_distr.description,
-                name=orm_distr.name,
-                encoding_format=orm_distr.encoding_format,
-            )
-            for orm_distr in orm.distributions
-        ],
-        keywords=[keyword.name for keyword in orm.keywords],
-        measured_values=[
-            AIoDMeasurementValue(variable=mv.variable, technique=mv.technique)
-            for mv in orm.measured_values
-        ],
-    )
+    return AIoDDatasetOut.construct(**orm_to_aiod_dict(orm))
+
+
+def orm_to_aiod_dict(orm: OrmDataset) -> dict:
+    """
+    Converting between dataset representations: the database variant (OrmDataset) towards a
+    dictionary in AIoD format, equal to the json of the AIoD schema (excluding None values).
+
+    This bypasses pydantic completely, so that the dictionary can be serialized directly.
+
+    All relationships of the OrmDataset are accessed. When converting multiple datasets, make sure
+    they are queried using the DATASET_LOAD_OPTIONS, to prevent a lazy load per relationship per
+    dataset.
+    """
+    fields = _exclude_none(zip(_SCALAR_FIELDS, _get_scalar_fields(orm)))
+    license_ = orm.license
+    if license_ is not None:
+        fields["license"] = license_.name
+    fields["has_parts"] = [str(part.id) for part in orm.has_parts]
+    fields["is_part"] = [str(part.id) for part in orm.is_part]
+    fields["alternate_names"] = [alias.name for alias in orm.alternate_names]
+    fields["citations"] = [str(citation.id) for citation in orm.citations]
+    fields["distributions"] = [
+        _exclude_none(zip(_DISTRIBUTION_FIELDS, _get_distribution_fields(orm_distr)))
+        for orm_distr in orm.distributions
+    ]
+    fields["keywords"] = [keyword.name for keyword in orm.keywords]
+    fields["measured_values"] = [
+        _exclude_none(zip(_MEASURED_VALUE_FIELDS, _get_measured_value_fields(mv)))
+        for mv in orm.measured_values
+    ]
+    return fields
+
+
+def _exclude_none(fields: Iterable[Tuple[str, Any]]) -> dict:
+    return {field: value for field, value in fields if value is not None}
 
 
 def aiod_to_orm(session: Session, aiod: AIoDDataset) -> OrmDataset:
@@ -69,14 +111,14 @@ def aiod_to_orm(session: Session, aiod: AIoDDataset) -> OrmDataset:
     Converting between dataset representations: the AIoD schema towards the database variant (
     OrmDataset)
     """
-
-    if isinstance(aiod.citations, List):
-        # TODO(issue 7): retrieve OrmPublication from AIoDPublication
-        citations = []
-    else:
-        citations = _retrieve_related_objects_by_ids(session, aiod.citations, OrmPublication)
-    has_parts = _retrieve_related_objects_by_ids(session, aiod.has_parts, OrmDataset)
-    is_part = _retrieve_related_objects_by_ids(session, aiod.is_part, OrmDataset)
+    citations, has_parts, is_part = _retrieve_related_objects_batched(
+        session,
+        [
+            (_citation_ids(aiod), OrmPublication),
+            (aiod.has_parts, OrmDataset),
+            (aiod.is_part, OrmDataset),
+        ],
+    )
 
     orm = OrmDataset(
         description=aiod.description,
@@ -100,45 +142,195 @@ def aiod_to_orm(session: Session, aiod: AIoDDataset) -> OrmDataset:
         else None,
         has_parts=has_parts,
         is_part=is_part,
-        alternate_names=[
-            OrmAlternateName.as_unique(session=session, name=alias)
-            for alias in aiod.alternate_names
-        ],
+        alternate_names=OrmAlternateName.as_unique_bulk(
+            session=session, kws=[{"name": alias} for alias in dict.fromkeys(aiod.alternate_names)]
+        ),
         citations=citations,
         distributions=[
             OrmDataDownload(
-                content_url=orm_distr.content_url,
-                content_size_kb=orm_distr.content_size_kb,
-                description=orm_distr.description,
-                name=orm_distr.name,
-                encoding_format=orm_distr.encoding_format,
+                content_url=distr.content_url,
+                content_size_kb=distr.content_size_kb,
+                description=distr.description,
+                name=distr.name,
+                encoding_format=distr.encoding_format,
             )
-            for orm_distr in aiod.distributions
-        ],
-        keywords=[OrmKeyword.as_unique(session=session, name=keyword) for keyword in aiod.keywords],
-        measured_values=[
-            OrmMeasuredValue.as_unique(
-                session=session, variable=mv.variable, technique=mv.technique
-            )
-            for mv in aiod.measured_values
+            for distr in aiod.distributions
         ],
+        keywords=OrmKeyword.as_unique_bulk(
+            session=session, kws=[{"name": keyword} for keyword in dict.fromkeys(aiod.keywords)]
+        ),
+        measured_values=OrmMeasuredValue.as_unique_bulk(
+            session=session,
+            kws=_measured_value_kws(aiod),
+        ),
     )
     orm.id = aiod.id
     return orm
 
 
+def aiod_update_orm(session: Session, existing: OrmDataset, aiod: AIoDDataset) -> OrmDataset:
+    """
+    Updating the database variant (OrmDataset) in place, so that it corresponds with the AIoD
+    schema.
+
+    Contrary to creating a new OrmDataset using aiod_to_orm, only the fields that changed are
+    assigned, and only the related objects that were not related yet are retrieved.
+    """
+    for field in _SCALAR_FIELDS:
+        if field != "id" and getattr(existing, field) != (value := getattr(aiod, field)):
+            setattr(existing, field, value)
+
+    license_ = existing.license
+    if aiod.license != (license_.name if license_ is not None else None):
+        existing.license = (
+            OrmLicense.as_unique(session=session, name=aiod.license)
+            if aiod.license is not None
+            else None
+        )
+
+    relations = [
+        ("citations", OrmPublication, _citation_ids(aiod)),
+        ("has_parts", OrmDataset, aiod.has_parts),
+        ("is_part", OrmDataset, aiod.is_part),
+    ]
+    related_by_id = {
+        field: {str(obj.id): obj for obj in getattr(existing, field)} for field, _, _ in relations
+    }
+    new_ids = [
+        list(dict.fromkeys(id_ for id_ in map(str, ids) if id_ not in related_by_id[field]))
+        for field, _, ids in relations
+    ]
+    retrieved = _retrieve_related_objects_batched(
+        session, [(ids, cls) for ids, (_, cls, _) in zip(new_ids, relations)]
+    )
+    for (field, _, ids), field_new_ids, retrieved_objects in zip(relations, new_ids, retrieved):
+        by_id = related_by_id[field]
+        by_id.update(zip(field_new_ids, retrieved_objects))
+        _update_relationship(existing, field, [by_id[id_] for id_ in dict.fromkeys(map(str, ids))])
+
+    _update_relationship(
+        existing,
+        "alternate_names",
+        _reuse_or_retrieve_unique(
+            session,
+            OrmAlternateName,
+            existing.alternate_names,
+            ("name",),
+            [{"name": alias} for alias in dict.fromkeys(aiod.alternate_names)],
+        ),
+    )
+    _update_relationship(
+        existing,
+        "keywords",
+        _reuse_or_retrieve_unique(
+            session,
+            OrmKeyword,
+            existing.keywords,
+            ("name",),
+            [{"name": keyword} for keyword in dict.fromkeys(aiod.keywords)],
+        ),
+    )
+    _update_relationship(
+        existing,
+        "measured_values",
+        _reuse_or_retrieve_unique(
+            session,
+            OrmMeasuredValue,
+            existing.measured_values,
+            ("variable", "technique"),
+            _measured_value_kws(aiod),
+        ),
+    )
+
+    distributions_by_url = {distr.content_url: distr for distr in existing.distributions}
+    distributions = []
+    for distr in aiod.distributions:
+        orm_distr = distributions_by_url.get(distr.content_url)
+        if orm_distr is None:
+            orm_distr = OrmDataDownload(content_url=distr.content_url)
+        for field in _DISTRIBUTION_FIELDS:
+            if getattr(orm_distr, field) != (value := getattr(distr, field)):
+                setattr(orm_distr, field, value)
+        distributions.append(orm_distr)
+    for orm_distr in existing.distributions:
+        if all(orm_distr is not distr for distr in distributions):
+            # The content_url is unique, so a dropped distribution would block re-adding it later
+            session.delete(orm_distr)
+    _update_relationship(existing, "distributions", distributions)
+    return existing
+
+
+def _citation_ids(aiod: AIoDDataset) -> Set[str]:
+    if not aiod.citations:  # The common case, checked first
+        return set()
+    if isinstance(aiod.citations, List):
+        # TODO(issue 7): retrieve OrmPublication from AIoDPublication
+        return set()
+    return aiod.citations
+
+
+def _measured_value_kws(aiod: AIoDDataset) -> List[dict]:
+    # dict.fromkeys removes duplicated measured values, preserving the order
+    keys = dict.fromkeys((mv.variable, mv.technique) for mv in aiod.measured_values)
+    return [{"variable": variable, "technique": technique} for variable, technique in keys]
+
+
+def _reuse_or_retrieve_unique(
+    session: Session,
+    cls: Type[UniqueMixin],
+    existing: List,
+    fields: Tuple[str, ...],
+    kws: List[dict],
+) -> List:
+    """
+    The equivalent of cls.as_unique_bulk(session, kws), reusing the existing instances where
+    possible, so that only the new instances are retrieved.
+    """
+    existing_by_key = {tuple(getattr(obj, field) for field in fields): obj for obj in existing}
+    keys = [tuple(kw[field] for field in fields) for kw in kws]
+    new = [(key, kw) for key, kw in zip(keys, kws) if key not in existing_by_key]
+    new_kws = [kw for _, kw in new]
+    by_key = dict(existing_by_key)
+    by_key.update(zip((key for key, _ in new), cls.as_unique_bulk(session=session, kws=new_kws)))
+    return [by_key[key] for key in keys]
+
+
+def _update_relationship(orm: OrmDataset, field: str, value: List) -> None:
+    """Assign the relationship, only if it changed, to avoid unnecessary updates."""
+    current = getattr(orm, field)
+    if len(current) != len(value) or any(a is not b for a, b in zip(current, value)):
+        setattr(orm, field, value)
+
+
 T = TypeVar("T", bound=Base)
 
 
-def _retrieve_related_objects_by_ids(session: Session, ids: Set[str], cls: Type[T]) -> List[T]:
-    related_objects = []
-    if len(ids) > 0:
-        query = select(cls).where(cls.id.in_(ids))
-        related_objects = session.scalars(query).all()
-        if len(related_objects) != len(ids):
-            ids_not_found = set(ids) - {c.id for c in related_objects}
-            raise HTTPException(
-                status_code=404,
-                detail=f"Dataset parts '{', '.join(ids_not_found)}' not found in the database.",
-            )
-    return related_objects
+def _retrieve_related_objects_batched(
+    session: Session, requests: List[Tuple[Iterable[str], Type[T]]]
+) -> List[List[T]]:
+    """
+    Retrieve the related objects for each (ids, cls) request, using a single query per class.
+
+    For instance, the has_parts and is_part of a dataset both refer to OrmDatasets, so they are
+    retrieved together. A 404 is raised if any of the requested ids is not found.
+    """
+    # dict.fromkeys removes duplicated ids, preserving the order
+    requests_as_str = [(list(dict.fromkeys(str(id_) for id_ in ids)), cls) for ids, cls in requests]
+    ids_per_cls: Dict[Type[T], Set[str]] = {}
+    for ids, cls in requests_as_str:
+        ids_per_cls.setdefault(cls, set()).update(ids)
+
+    objects_per_cls: Dict[Type[T], Dict[str, T]] = {}
+    ids_not_found: Set[str] = set()
+    for cls, cls_ids in ids_per_cls.items():
+        if len(cls_ids) > 0:
+            query = select(cls).where(cls.id.in_(cls_ids)).execution_options(yield_per=512)
+            objects = {str(obj.id): obj for obj in session.scalars(query)}
+            ids_not_found |= cls_ids - objects.keys()
+            objects_per_cls[cls] = objects
+    if len(ids_not_found) > 0:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Dataset parts '{', '.join(sorted(ids_not_found))}' not found in the database.",
+        )
+    return [[objects_per_cls[cls][id_] for id_ in ids] for ids, cls in requests_as_str]
@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import UniqueConstraint, String, DateTime, Boolean, and_
+from sqlalchemy import UniqueConstraint, String, DateTime, Boolean, and_, or_
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from database.model.dataset_relationships import (
@@ -47,7 +47,9 @@ class OrmDataset(Base):
     # Recommended fields
     creator: Mapped[str] = mapped_column(String(150), default=None, nullable=True)
     # TODO(issue 9): creator repeated organization/person
-    date_modified: Mapped[datetime] = mapped_column(DateTime, nullable=True, default=None)
+    date_modified: Mapped[datetime] = mapped_column(
+        DateTime, nullable=True, default=None, index=True
+    )
     date_published: Mapped[datetime] = mapped_column(DateTime, nullable=True, default=None)
     funder: Mapped[str] = mapped_column(String(150), default=None, nullable=True)
     # TODO(issue 9): funder repeated organization/person
@@ -60,7 +62,7 @@ class OrmDataset(Base):
     version: Mapped[str] = mapped_column(String(150), default=None, nullable=True)
 
     # Relations
-    license: Mapped["OrmLicense"] = relationship(
+    license: Mapped["OrmLicense | None"] = relationship(
         back_populates="datasets", secondary=dataset_license_relationship, default=None
     )
     has_parts: Mapped[list["OrmDataset"]] = relationship(
@@ -131,6 +133,17 @@ class OrmMeasuredValue(UniqueMixin, Base):
     def _unique_filter(cls, query, variable, technique):
         return query.filter(and_(cls.variable == variable, cls.technique == technique))
 
+    @classmethod
+    def _unique_filter_bulk(cls, query, kws):
+        return query.filter(
+            or_(
+                *[
+                    and_(cls.variable == kw["variable"], cls.technique == kw["technique"])
+                    for kw in kws
+                ]
+            )
+        )
+
     __tablename__ = "measured_values"
     __table_args__ = (
         UniqueConstraint(
@@ -165,6 +178,10 @@ class OrmAlternateName(UniqueMixin, Base):
     def _unique_filter(cls, query, name):
         return query.filter(cls.name == name)
 
+    @classmethod
+    def _unique_filter_bulk(cls, query, kws):
+        return query.filter(cls.name.in_([kw["name"] for kw in kws]))
+
     __tablename__ = "alternate_names"
     id: Mapped[int] = mapped_column(init=False, primary_key=True)
     name: Mapped[str] = mapped_column(String(150), unique=True)
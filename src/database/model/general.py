@@ -67,6 +67,10 @@ class OrmKeyword(UniqueMixin, Base):
     def _unique_filter(cls, query, name):
         return query.filter(cls.name == name)
 
+    @classmethod
+    def _unique_filter_bulk(cls, query, kws):
+        return query.filter(cls.name.in_([kw["name"] for kw in kws]))
+
     __tablename__ = "keywords"
     id: Mapped[int] = mapped_column(init=False, primary_key=True)
     name: Mapped[str] = mapped_column(String(150), unique=True)
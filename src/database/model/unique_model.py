@@ -1,3 +1,6 @@
+import unicodedata
+
+
 class UniqueMixin(object):
     """
     Add the as_unique() function to a database object, to get the existing instance if it already
@@ -18,10 +21,22 @@ class UniqueMixin(object):
     def _unique_filter(cls, query, *arg, **kw):
         raise NotImplementedError()
 
+    @classmethod
+    def _unique_filter_bulk(cls, query, kws):
+        raise NotImplementedError()
+
     @classmethod
     def as_unique(cls, session, *arg, **kw):
         return _unique(session, cls, cls._unique_hash, cls._unique_filter, cls, arg, kw)
 
+    @classmethod
+    def as_unique_bulk(cls, session, kws):
+        """
+        The equivalent of [cls.as_unique(session, **kw) for kw in kws], retrieving all existing
+        instances using a single query, instead of a query per instance.
+        """
+        return _unique_bulk(session, cls, cls._unique_hash, cls._unique_filter_bulk, cls, kws)
+
 
 def _unique(session, cls, hashfunc, queryfunc, constructor, arg, kw):
     cache = getattr(session, "_unique_cache", None)
@@ -41,3 +56,50 @@ def _unique(session, cls, hashfunc, queryfunc, constructor, arg, kw):
                 session.add(obj)
         cache[key] = obj
         return obj
+
+
+def _unique_bulk(session, cls, hashfunc, queryfunc, constructor, kws):
+    cache = getattr(session, "_unique_cache", None)
+    if cache is None:
+        session._unique_cache = cache = {}
+
+    keys = [(cls, hashfunc(**kw)) for kw in kws]
+    not_cached = {key: kw for key, kw in zip(keys, kws) if key not in cache}
+    if not_cached:
+        fields = next(iter(not_cached.values())).keys()
+        # The database may consider values equal that differ in Python (e.g., the case-insensitive
+        # collation of MySQL), so the found instances are indexed on their collation key as well.
+        found_by_collation_key = {}
+        with session.no_autoflush:
+            q = session.query(cls)
+            q = queryfunc(q, list(not_cached.values()))
+            for obj in q:
+                obj_kw = {field: getattr(obj, field) for field in fields}
+                cache[(cls, hashfunc(**obj_kw))] = obj
+                found_by_collation_key[_collation_key(obj_kw)] = obj
+            for key, kw in not_cached.items():
+                if key not in cache:
+                    collation_key = _collation_key(kw)
+                    obj = found_by_collation_key.get(collation_key)
+                    if obj is None:
+                        obj = constructor(**kw)
+                        session.add(obj)
+                        found_by_collation_key[collation_key] = obj
+                    cache[key] = obj
+    return [cache[key] for key in keys]
+
+
+def _collation_key(kw):
+    """
+    Approximation of the default MySQL collation: case-insensitive, accent-insensitive and
+    ignoring trailing spaces.
+    """
+    return tuple((field, _collate(value)) for field, value in sorted(kw.items()))
+
+
+def _collate(value):
+    if not isinstance(value, str):
+        return value
+    decomposed = unicodedata.normalize("NFKD", value)
+    without_accents = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return without_accents.casefold().rstrip(" ")
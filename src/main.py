@@ -5,17 +5,22 @@ Note: order matters for overloaded paths
 (https://fastapi.tiangolo.com/tutorial/path-params/#order-matters).
 """
 import argparse
+import functools
+import hashlib
 import os
 import tomllib
+import time
 import traceback
+import uuid
 from typing import Dict
 
+import orjson
 import uvicorn
 from dotenv import load_dotenv
-from fastapi import Depends, FastAPI, HTTPException
-from fastapi.responses import HTMLResponse
+from fastapi import Depends, FastAPI, Header, HTTPException
+from fastapi.responses import HTMLResponse, ORJSONResponse, Response
 from pydantic import BaseModel, Json
-from sqlalchemy import select, Engine, and_, delete, update
+from sqlalchemy import select, Engine, and_, delete, func, update
 from sqlalchemy.exc import IntegrityError, OperationalError
 from sqlalchemy.orm import Session
 
@@ -30,6 +35,11 @@ from database.model.publication import OrmPublication
 from database.setup import connect_to_database, populate_database
 
 
+# The maximum number of seconds a serialized list of datasets is cached, see add_routes. Keep the
+# docstrings of the list endpoints in sync.
+DATASETS_CACHE_TTL = 30
+
+
 def _parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Please refer to the README.")
     parser.add_argument("--url-prefix", default="", help="Prefix for the api url.")
@@ -203,35 +213,93 @@ def add_routes(app: FastAPI, engine: Engine, url_prefix=""):
         """
         return {"msg": "success", "user": user}
 
-    @app.get(url_prefix + "/datasets/", response_model_exclude_none=True)
+    # The serialized lists of datasets are cached. The version of the datasets, used as cache key
+    # and ETag, is derived from the database on each request, using the indexed id and
+    # date_modified, so that datasets added by other processes (other workers, scripts) invalidate
+    # the cache as well. Each change made through the endpoints of this process increments
+    # datasets_version, which catches updates and deletions. Other changes made by other processes
+    # are not detected, so cached lists expire after DATASETS_CACHE_TTL seconds.
+    datasets_version = 0
+    etag_prefix = uuid.uuid4().hex
+
+    def _datasets_changed():
+        nonlocal datasets_version
+        datasets_version += 1
+
+    # Exposed, so that the cache can be invalidated after changing the datasets externally without
+    # changing the version derived from the database (e.g., when the tests empty the tables).
+    app.state.datasets_changed = _datasets_changed
+
+    def _current_datasets_version() -> tuple:
+        query = select(func.max(OrmDataset.id), func.max(OrmDataset.date_modified))
+        with Session(engine) as session:
+            max_id, max_date_modified = session.execute(query).one()
+        expiry = int(time.monotonic() // DATASETS_CACHE_TTL)
+        return datasets_version, max_id, max_date_modified, expiry
+
+    @functools.lru_cache(maxsize=128)
+    def _serialized_datasets(version: tuple, node: str | None, offset: int, limit: int) -> bytes:
+        """The version is only used as part of the cache key."""
+        # For additional information on querying through SQLAlchemy's ORM:
+        # https://docs.sqlalchemy.org/en/20/orm/queryguide/index.html
+        with Session(engine) as session:
+            query = select(OrmDataset).options(*dataset_converter.DATASET_LOAD_OPTIONS)
+            if node is not None:
+                query = query.where(OrmDataset.node == node)
+            query = query.offset(offset).limit(limit)
+            # The datasets are trusted, so they are serialized without pydantic validation
+            return orjson.dumps(
+                [
+                    dataset_converter.orm_to_aiod_dict(dataset)
+                    for dataset in session.scalars(query).all()
+                ]
+            )
+
+    def _datasets_response(
+        node: str | None, pagination: Pagination, if_none_match: str | None
+    ) -> Response:
+        version = _current_datasets_version()
+        version_hash = hashlib.sha1(repr(version).encode()).hexdigest()
+        etag = f'"{etag_prefix}-{version_hash}"'
+        if if_none_match == etag:
+            return Response(status_code=304, headers={"ETag": etag})
+        content = _serialized_datasets(version, node, pagination.offset, pagination.limit)
+        return Response(content=content, media_type="application/json", headers={"ETag": etag})
+
+    @app.get(
+        url_prefix + "/datasets/",
+        response_model=list[schemas.AIoDDatasetOut],
+        response_class=ORJSONResponse,
+    )
     def list_datasets(
         pagination: Pagination = Depends(Pagination),
-    ) -> list[schemas.AIoDDataset]:
+        if_none_match: str | None = Header(default=None),
+    ) -> Response:
         """Lists all datasets registered with AIoD.
 
         Query Parameter
         ------
          * nodes, list[str], optional: if provided, list only datasets from the given node.
+
+        The list is cached. Changes that are not new datasets, made by other servers or directly
+        in the database, can take up to 30 seconds to show up.
         """
-        # For additional information on querying through SQLAlchemy's ORM:
-        # https://docs.sqlalchemy.org/en/20/orm/queryguide/index.html
         try:
-            with Session(engine) as session:
-                query = select(OrmDataset).offset(pagination.offset).limit(pagination.limit)
-                return [
-                    dataset_converter.orm_to_aiod(dataset)
-                    for dataset in session.scalars(query).all()
-                ]
+            return _datasets_response(None, pagination, if_none_match)
         except Exception as e:
             raise _wrap_as_http_exception(e)
 
-    @app.get(url_prefix + "/datasets/{identifier}", response_model_exclude_none=True)
-    def get_dataset(identifier: str) -> schemas.AIoDDataset:
+    @app.get(
+        url_prefix + "/datasets/{identifier}",
+        response_model=schemas.AIoDDatasetOut,
+        response_class=ORJSONResponse,
+    )
+    def get_dataset(identifier: str) -> ORJSONResponse:
         """Retrieve all meta-data for a specific dataset."""
         try:
             with Session(engine) as session:
                 dataset = _retrieve_dataset(session, identifier)
-                return dataset_converter.orm_to_aiod(dataset)
+                return ORJSONResponse(dataset_converter.orm_to_aiod_dict(dataset))
         except Exception as e:
             raise _wrap_as_http_exception(e)
 
@@ -240,39 +308,43 @@ def add_routes(app: FastAPI, engine: Engine, url_prefix=""):
         """Retrieve information about all known nodes"""
         return list(NodeName)
 
-    @app.get(url_prefix + "/nodes/{node}/datasets", response_model_exclude_none=True)
+    @app.get(
+        url_prefix + "/nodes/{node}/datasets",
+        response_model=list[schemas.AIoDDatasetOut],
+        response_class=ORJSONResponse,
+    )
     def get_node_datasets(
-        node: str, pagination: Pagination = Depends(Pagination)
-    ) -> list[schemas.AIoDDataset]:
-        """Retrieve all meta-data of the datasets of a single node."""
+        node: str,
+        pagination: Pagination = Depends(Pagination),
+        if_none_match: str | None = Header(default=None),
+    ) -> Response:
+        """Retrieve all meta-data of the datasets of a single node.
+
+        The list is cached. Changes that are not new datasets, made by other servers or directly
+        in the database, can take up to 30 seconds to show up.
+        """
         try:
-            with Session(engine) as session:
-                query = (
-                    select(OrmDataset)
-                    .where(OrmDataset.node == node)
-                    .offset(pagination.offset)
-                    .limit(pagination.limit)
-                )
-                return [
-                    dataset_converter.orm_to_aiod(dataset)
-                    for dataset in session.scalars(query).all()
-                ]
+            return _datasets_response(node, pagination, if_none_match)
         except Exception as e:
             raise _wrap_as_http_exception(e)
 
-    @app.get(url_prefix + "/nodes/{node}/datasets/{identifier}", response_model_exclude_none=True)
-    def get_node_dataset(node: str, identifier: str) -> schemas.AIoDDataset:
+    @app.get(
+        url_prefix + "/nodes/{node}/datasets/{identifier}",
+        response_model=schemas.AIoDDatasetOut,
+        response_class=ORJSONResponse,
+    )
+    def get_node_dataset(node: str, identifier: str) -> ORJSONResponse:
         """Retrieve all meta-data for a specific dataset identified by the
         node-specific-identifier."""
         try:
             with Session(engine) as session:
                 dataset = _retrieve_dataset(session, identifier, node)
-                return dataset_converter.orm_to_aiod(dataset)
+                return ORJSONResponse(dataset_converter.orm_to_aiod_dict(dataset))
         except Exception as e:
             raise _wrap_as_http_exception(e)
 
     @app.post(url_prefix + "/datasets/", response_model_exclude_none=True)
-    def register_dataset(dataset: schemas.AIoDDataset) -> schemas.AIoDDataset:
+    def register_dataset(dataset: schemas.AIoDDataset) -> schemas.AIoDDatasetOut:
         """Register a dataset with AIoD."""
         try:
             with Session(engine) as session:
@@ -294,22 +366,21 @@ def add_routes(app: FastAPI, engine: Engine, url_prefix=""):
                         detail="There already exists a dataset with the same "
                         f"node and name, with id={existing_dataset.id}.",
                     )
+                _datasets_changed()
                 return dataset_converter.orm_to_aiod(dataset_orm)
         except Exception as e:
             raise _wrap_as_http_exception(e)
 
     @app.put(url_prefix + "/datasets/{identifier}", response_model_exclude_none=True)
-    def put_dataset(identifier: str, dataset: schemas.AIoDDataset) -> schemas.AIoDDataset:
+    def put_dataset(identifier: str, dataset: schemas.AIoDDataset) -> schemas.AIoDDatasetOut:
         """Update an existing dataset."""
         try:
             with Session(engine) as session:
-                _retrieve_dataset(session, identifier)  # Raise error if it does not exist
-                dataset_orm = dataset_converter.aiod_to_orm(session, dataset)
-                dataset_orm.id = identifier
-                session.merge(dataset_orm)
+                existing_dataset = _retrieve_dataset(session, identifier)
+                dataset_converter.aiod_update_orm(session, existing_dataset, dataset)
                 session.commit()
-                new_dataset = _retrieve_dataset(session, identifier)
-                return dataset_converter.orm_to_aiod(new_dataset)
+                _datasets_changed()
+                return dataset_converter.orm_to_aiod(existing_dataset)
         except Exception as e:
             raise _wrap_as_http_exception(e)
 
@@ -322,6 +393,7 @@ def add_routes(app: FastAPI, engine: Engine, url_prefix=""):
                 statement = delete(OrmDataset).where(OrmDataset.id == identifier)
                 session.execute(statement)
                 session.commit()
+                _datasets_changed()
         except Exception as e:
             raise _wrap_as_http_exception(e)
 
@@ -391,6 +463,7 @@ def add_routes(app: FastAPI, engine: Engine, url_prefix=""):
                 statement = delete(OrmPublication).where(OrmPublication.id == identifier)
                 session.execute(statement)
                 session.commit()
+                _datasets_changed()
         except Exception as e:
             raise _wrap_as_http_exception(e)
 
@@ -418,6 +491,7 @@ def add_routes(app: FastAPI, engine: Engine, url_prefix=""):
                     )
                 dataset.citations.append(publication)
                 session.commit()
+                _datasets_changed()
         except Exception as e:
             raise _wrap_as_http_exception(e)
 
@@ -435,6 +509,7 @@ def add_routes(app: FastAPI, engine: Engine, url_prefix=""):
                     )
                 dataset.citations = [p for p in dataset.citations if p != publication]
                 session.commit()
+                _datasets_changed()
         except Exception as e:
             raise _wrap_as_http_exception(e)
 
@@ -444,39 +519,36 @@ def add_routes(app: FastAPI, engine: Engine, url_prefix=""):
         try:
             with Session(engine) as session:
                 tags = []
-                if news.tags:
-                    for t in news.tags:
-                        query = select(Tag).where(Tag.tag == t)
-                        tag = session.scalars(query).first()
-                        if not tag:
-                            raise HTTPException(
-                                status_code=404,
-                                detail=f"Tag '{t}' not found in the database.",
-                            )
-                        tags.append(tag)
+                for t in news.tags or []:
+                    query = select(Tag).where(Tag.tag == t)
+                    tag = session.scalars(query).first()
+                    if not tag:
+                        raise HTTPException(
+                            status_code=404,
+                            detail=f"Tag '{t}' not found in the database.",
+                        )
+                    tags.append(tag)
 
                 business_categories = []
-                if news.business_categories:
-                    for c in news.business_categories:
-                        query = select(BusinessCategory).where(BusinessCategory.category == c)
-                        category = session.scalars(query).first()
-                        if not category:
-                            raise HTTPException(
-                                status_code=404,
-                                detail=f"Business category '{c}' not found in the database.",
-                            )
-                        business_categories.append(category)
+                for c in news.business_categories or []:
+                    query = select(BusinessCategory).where(BusinessCategory.category == c)
+                    category = session.scalars(query).first()
+                    if not category:
+                        raise HTTPException(
+                            status_code=404,
+                            detail=f"Business category '{c}' not found in the database.",
+                        )
+                    business_categories.append(category)
                 news_categories = []
-                if news.news_categories:
-                    for c in news.news_categories:
-                        query = select(NewsCategory).where(NewsCategory.category == c)
-                        category = session.scalars(query).first()
-                        if not category:
-                            raise HTTPException(
-                                status_code=404,
-                                detail=f"News category '{c}' not found in the database.",
-                            )
-                        news_categories.append(category)
+                for c in news.news_categories or []:
+                    query = select(NewsCategory).where(NewsCategory.category == c)
+                    category = session.scalars(query).first()
+                    if not category:
+                        raise HTTPException(
+                            status_code=404,
+                            detail=f"News category '{c}' not found in the database.",
+                        )
+                    news_categories.append(category)
 
                 new_news = News(
                     title=news.title,
@@ -5,7 +5,7 @@ Note that these objects are different from the ORM objects defined in the databa
 code duplication, so it is not ideal. But it makes it possible to differentiate between the database
 objects and the externally used AIoD schemas. The dataset, for example, contains keywords,
 which should be a separate object inside a separate table in the database (so that we can easily
-search for all datasets having the same keyword). In the external schema, a set of strings is
+search for all datasets having the same keyword). In the external schema, a list of strings is
 easier.
 """
 from datetime import datetime
@@ -63,21 +63,77 @@ class AIoDDataset(BaseModel):
 
     # Relations
     license: str | None = Field(max_length=150)
-    has_parts: Set[str] = Field(
+    has_parts: List[str] = Field(
         description="Identifiers of datasets that are part of this " "dataset.",
-        default_factory=set,
+        default_factory=list,
     )
-    is_part: Set[str] = Field(
-        description="Identifiers of datasets this dataset is part of.", default_factory=set
+    is_part: List[str] = Field(
+        description="Identifiers of datasets this dataset is part of.", default_factory=list
     )
-    alternate_names: Set[str] = Field(default_factory=set)
+    alternate_names: List[str] = Field(default_factory=list)
     citations: Set[str] | List[AIoDPublication] = Field(
         description="Identifiers of publications linked to this dataset, or the actual "
         "publications",
         default_factory=set,
     )
     distributions: List[AIoDDistribution] = []
-    keywords: Set[str] = Field(default_factory=set)
+    keywords: List[str] = Field(default_factory=list)
+    measured_values: List[AIoDMeasurementValue] = Field(default_factory=list)
+
+
+class AIoDDistributionOut(BaseModel):
+    """An AIoDDistribution, without the constraints that are only needed to validate input."""
+
+    content_url: str
+    content_size_kb: int | None
+    description: str | None
+    name: str | None
+    encoding_format: str | None
+
+
+class AIoDDatasetOut(BaseModel):
+    """
+    The complete metadata of a dataset in AIoD format, as returned by the API.
+
+    Equal to the AIoDDataset, but without the field constraints: the output originates from the
+    database, so validating the constraints again is unnecessary overhead.
+    """
+
+    id: int | None
+    description: str
+    name: str
+    node: str
+    node_specific_identifier: str
+    same_as: str
+
+    # Recommended fields
+    creator: str | None
+    date_modified: datetime | None
+    date_published: datetime | None
+    funder: str | None
+    is_accessible_for_free: bool | None
+    issn: str | None
+    size: int | None
+    spatial_coverage: str | None
+    temporal_coverage_from: datetime | None
+    temporal_coverage_to: datetime | None
+    version: str | None
+
+    # Relations
+    license: str | None
+    has_parts: List[str] = Field(
+        description="Identifiers of datasets that are part of this dataset.",
+        default_factory=list,
+    )
+    is_part: List[str] = Field(
+        description="Identifiers of datasets this dataset is part of.", default_factory=list
+    )
+    alternate_names: List[str] = Field(default_factory=list)
+    citations: List[str] = Field(
+        description="Identifiers of publications linked to this dataset.", default_factory=list
+    )
+    distributions: List[AIoDDistributionOut] = Field(default_factory=list)
+    keywords: List[str] = Field(default_factory=list)
     measured_values: List[AIoDMeasurementValue] = Field(default_factory=list)
 
 
@@ -114,9 +170,9 @@ class News(BaseModel):
     section: str = Field(max_length=500)
     word_count: int
 
-    media: Optional[list[str]]
+    media: list[str] | None = None
     source: Optional[str]
-    news_categories: Optional[list[str]]
-    business_categories: Optional[list[str]]
-    tags: Optional[list[str]]
+    news_categories: list[str] | None = None
+    business_categories: list[str] | None = None
+    tags: list[str] | None = None
     id: int | None
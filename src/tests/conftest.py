@@ -10,10 +10,11 @@ from database.model.base import Base
 from main import add_routes
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def engine() -> Iterator[Engine]:
     """
-    Create a SqlAlchemy engine for tests, backed by a temporary sqlite file.
+    Create a SqlAlchemy engine for tests, backed by a temporary sqlite file. The tables are created
+    once per test session, and emptied after each test by `clear_tables`.
     """
     temporary_file = tempfile.NamedTemporaryFile()
     engine = create_engine(f"sqlite:///{temporary_file.name}")
@@ -22,7 +23,21 @@ def engine() -> Iterator[Engine]:
     yield engine
 
 
-@pytest.fixture
+@pytest.fixture(autouse=True)
+def clear_tables(request: pytest.FixtureRequest, engine: Engine) -> Iterator[None]:
+    """
+    Delete all rows after each test, which is a lot cheaper than recreating the database. The
+    application is reused as well, so its caches are invalidated.
+    """
+    yield
+    with engine.begin() as connection:
+        for table in reversed(Base.metadata.sorted_tables):
+            connection.execute(table.delete())
+    if "client" in request.fixturenames:
+        request.getfixturevalue("client").app.state.datasets_changed()
+
+
+@pytest.fixture(scope="module")
 def client(engine: Engine) -> TestClient:
     """
     Create a TestClient that can be used to mock sending requests to our application
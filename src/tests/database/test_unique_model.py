@@ -0,0 +1,66 @@
+from sqlalchemy import Engine, event, func
+from sqlalchemy.orm import Session
+
+from database.model.general import OrmKeyword
+
+
+def test_as_unique_bulk(engine: Engine):
+    with Session(engine) as session:
+        session.add(OrmKeyword(name="k1"))
+        session.commit()
+
+    with Session(engine) as session:
+        keywords = OrmKeyword.as_unique_bulk(
+            session, [{"name": "k1"}, {"name": "k2"}, {"name": "k1"}]
+        )
+        assert [keyword.name for keyword in keywords] == ["k1", "k2", "k1"]
+        assert keywords[0] is keywords[2]
+        session.commit()
+        assert session.query(OrmKeyword).count() == 2
+
+
+def test_as_unique_bulk_single_query(engine: Engine):
+    with Session(engine) as session:
+        session.add(OrmKeyword(name="k0"))
+        session.commit()
+
+    statements = []
+
+    def count_statement(conn, cursor, statement, *_):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", count_statement)
+    try:
+        with Session(engine) as session:
+            keywords = OrmKeyword.as_unique_bulk(session, [{"name": f"k{i}"} for i in range(10)])
+            assert [keyword.name for keyword in keywords] == [f"k{i}" for i in range(10)]
+    finally:
+        event.remove(engine, "before_cursor_execute", count_statement)
+    assert len(statements) == 1
+
+
+def test_as_unique_bulk_database_comparison(engine: Engine, monkeypatch):
+    """
+    Simulate a case-insensitive collation, under which the database returns a value that differs
+    from the requested value.
+    """
+    monkeypatch.setattr(
+        OrmKeyword,
+        "_unique_filter_bulk",
+        classmethod(
+            lambda cls, query, kws: query.filter(
+                func.lower(cls.name).in_([kw["name"].lower() for kw in kws])
+            )
+        ),
+    )
+    with Session(engine) as session:
+        session.add(OrmKeyword(name="tabular"))
+        session.commit()
+
+    with Session(engine) as session:
+        keywords = OrmKeyword.as_unique_bulk(
+            session, [{"name": "Tabular"}, {"name": "images"}, {"name": "Images "}]
+        )
+        assert [keyword.name for keyword in keywords] == ["tabular", "images", "images"]
+        session.commit()
+        assert session.query(OrmKeyword).count() == 2
@@ -1,4 +1,5 @@
-from sqlalchemy import Engine
+import pytest
+from sqlalchemy import Engine, create_engine
 from sqlalchemy.orm import Session
 from starlette.testclient import TestClient
 
@@ -50,3 +51,73 @@ def test_happy_path(client: TestClient, engine: Engine):
     }
     for ds in response_json:
         assert len(ds) == 13
+
+
+def test_list_cached_until_changed(client: TestClient, engine: Engine):
+    response = client.get("/datasets")
+    assert response.status_code == 200
+    assert response.json() == []
+    etag = response.headers["ETag"]
+
+    response = client.get("/datasets", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+
+    response = client.post(
+        "/datasets",
+        json={
+            "name": "dset1",
+            "node": "openml",
+            "description": "a",
+            "same_as": "openml.eu/1",
+            "node_specific_identifier": "1",
+        },
+    )
+    assert response.status_code == 200
+
+    response = client.get("/datasets", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    assert [ds["name"] for ds in response.json()] == ["dset1"]
+
+
+def test_list_cache_invalidated_by_other_process(client: TestClient, engine: Engine):
+    response = client.get("/datasets")
+    assert response.json() == []
+    etag = response.headers["ETag"]
+
+    # A separate engine, like another worker or a script would use
+    other_engine = create_engine(engine.url)
+    with Session(other_engine) as session:
+        session.add(
+            OrmDataset(
+                name="dset1",
+                node="openml",
+                description="a",
+                same_as="openml.eu/1",
+                node_specific_identifier="1",
+            )
+        )
+        session.commit()
+    other_engine.dispose()
+
+    response = client.get("/datasets", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert [ds["name"] for ds in response.json()] == ["dset1"]
+
+
+@pytest.mark.parametrize("name", ["first", "second"])
+def test_list_not_cached_across_tests(client: TestClient, engine: Engine, name: str):
+    with Session(engine) as session:
+        session.add(
+            OrmDataset(
+                name=name,
+                node="openml",
+                description="a",
+                same_as="openml.eu/1",
+                node_specific_identifier="1",
+            )
+        )
+        session.commit()
+
+    response = client.get("/datasets")
+    assert [ds["name"] for ds in response.json()] == [name]
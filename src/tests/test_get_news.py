@@ -1,4 +1,4 @@
-import copy
+from typing import Callable
 
 import pytest
 from sqlalchemy import Engine
@@ -8,46 +8,63 @@ from datetime import datetime
 
 from database.model.news import News
 
+_DATE = datetime(2023, 3, 21)
 
-def test_happy_path_for_all(client: TestClient, engine: Engine):
-    date_format = "%Y-%m-%d"
-    news = [
-        News(
-            title="n1",
-            body="b1",
-            section="s1",
-            headline="h1",
-            source="s1",
-            date_modified=datetime.strptime("2023-03-21", date_format),
-            alternative_headline="ah1",
-            word_count=10,
-        ),
-        News(
-            title="n2",
-            body="b2",
-            section="s2",
-            headline="h2",
-            source="s2",
-            date_modified=datetime.strptime("2023-03-21", date_format),
-            alternative_headline="ah2",
-            word_count=10,
-        ),
-        News(
-            title="n3",
-            body="b3",
-            section="s3",
-            headline="h3",
-            source="s3",
-            date_modified=datetime.strptime("2023-03-21", date_format),
-            alternative_headline="ah3",
-            word_count=10,
-        ),
-    ]
+
+@pytest.fixture
+def make_news() -> Callable[[], list[News]]:
+    """
+    Factory creating fresh News instances on each call. SqlAlchemy changes the instances that are
+    added to a session, so that accessing the attributes is not possible anymore.
+    """
+
+    def _make_news() -> list[News]:
+        return [
+            News(
+                title="n1",
+                body="b1",
+                section="s1",
+                headline="h1",
+                source="s1",
+                date_modified=_DATE,
+                alternative_headline="ah1",
+                word_count=10,
+            ),
+            News(
+                title="n2",
+                body="b2",
+                section="s2",
+                headline="h2",
+                source="s2",
+                date_modified=_DATE,
+                alternative_headline="ah2",
+                word_count=10,
+            ),
+            News(
+                title="n3",
+                body="b3",
+                section="s3",
+                headline="h3",
+                source="s3",
+                date_modified=_DATE,
+                alternative_headline="ah3",
+                word_count=10,
+            ),
+        ]
+
+    return _make_news
+
+
+@pytest.fixture
+def news_rows(engine: Engine, make_news: Callable[[], list[News]]) -> list[News]:
+    """Populate the database with news, returning (unattached) instances equal to the rows."""
     with Session(engine) as session:
-        # Populate database
-        session.add_all(news)
+        session.add_all(make_news())
         session.commit()
+    return make_news()
 
+
+def test_happy_path_for_all(client: TestClient, news_rows: list[News]):
     response = client.get("/news")
     assert response.status_code == 200
     response_json = response.json()
@@ -69,52 +86,12 @@ def test_happy_path_for_all(client: TestClient, engine: Engine):
 
 
 @pytest.mark.parametrize("news_id", [1, 2])
-def test_happy_path_for_one(client: TestClient, engine: Engine, news_id: int):
-    date_format = "%Y-%m-%d"
-    news = [
-        News(
-            title="n1",
-            body="b1",
-            section="s1",
-            headline="h1",
-            source="s1",
-            date_modified=datetime.strptime("2023-03-21", date_format),
-            alternative_headline="ah1",
-            word_count=10,
-        ),
-        News(
-            title="n2",
-            body="b2",
-            section="s2",
-            headline="h2",
-            source="s2",
-            date_modified=datetime.strptime("2023-03-21", date_format),
-            alternative_headline="ah2",
-            word_count=10,
-        ),
-        News(
-            title="n3",
-            body="b3",
-            section="s3",
-            headline="h3",
-            source="s3",
-            date_modified=datetime.strptime("2023-03-21", date_format),
-            alternative_headline="ah3",
-            word_count=10,
-        ),
-    ]
-    with Session(engine) as session:
-        # Populate database
-        # Deepcopy necessary because SqlAlchemy changes the instance so that accessing the
-        # attributes is not possible anymore
-        session.add_all(copy.deepcopy(news))
-        session.commit()
-
+def test_happy_path_for_one(client: TestClient, news_rows: list[News], news_id: int):
     response = client.get(f"/news/{news_id}")
     assert response.status_code == 200
     response_json = response.json()
 
-    expected = news[news_id - 1]
+    expected = news_rows[news_id - 1]
     assert response_json["body"] == expected.body
     assert response_json["section"] == expected.section
     assert response_json["id"] == news_id
@@ -129,23 +106,12 @@ def test_empty_db(client: TestClient, engine: Engine, news_id):
 
 
 @pytest.mark.parametrize("news_id", [-1, 2, 3])
-def test_news_not_found(client: TestClient, engine: Engine, news_id):
-    date_format = "%Y-%m-%d"
-    news = [
-        News(
-            title="n1",
-            body="b1",
-            section="s1",
-            headline="h1",
-            source="s1",
-            date_modified=datetime.strptime("2023-03-21", date_format),
-            alternative_headline="ah1",
-            word_count=10,
-        ),
-    ]
+def test_news_not_found(
+    client: TestClient, engine: Engine, make_news: Callable[[], list[News]], news_id
+):
     with Session(engine) as session:
         # Populate database
-        session.add_all(news)
+        session.add_all(make_news()[:1])
         session.commit()
     response = client.get(f"/news/{news_id}")
     assert response.status_code == 404
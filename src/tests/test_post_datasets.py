@@ -5,7 +5,8 @@ from sqlalchemy import Engine
 from sqlalchemy.orm import Session
 from starlette.testclient import TestClient
 
-from database.model.dataset import OrmDataset
+from database.model.dataset import OrmDataset, OrmMeasuredValue
+from database.model.general import OrmKeyword
 
 
 def test_happy_path(client: TestClient, engine: Engine):
@@ -149,3 +150,85 @@ def test_null_value(client: TestClient, engine: Engine, field: str):
             "type": "type_error.none.not_allowed",
         }
     ]
+
+
+def test_related_datasets(client: TestClient, engine: Engine):
+    datasets = [
+        OrmDataset(
+            name=f"dset{i}",
+            node="openml",
+            description="",
+            same_as=f"openml.org/{i}",
+            node_specific_identifier=str(i),
+        )
+        for i in range(1, 4)
+    ]
+    with Session(engine) as session:
+        # Populate database
+        session.add_all(datasets)
+        session.commit()
+
+    data = {
+        "name": "dset4",
+        "node": "openml",
+        "description": "description",
+        "same_as": "openml.org/4",
+        "node_specific_identifier": "4",
+        "has_parts": ["1", "2"],
+        "is_part": ["3"],
+    }
+    response = client.post("/datasets", json=data)
+    assert response.status_code == 200
+    response_json = response.json()
+    assert set(response_json["has_parts"]) == {"1", "2"}
+    assert set(response_json["is_part"]) == {"3"}
+
+
+def test_related_datasets_not_found(client: TestClient, engine: Engine):
+    data = {
+        "name": "dset1",
+        "node": "openml",
+        "description": "description",
+        "same_as": "openml.org/1",
+        "node_specific_identifier": "1",
+        "has_parts": ["5"],
+        "is_part": ["6"],
+    }
+    response = client.post("/datasets", json=data)
+    assert response.status_code == 404
+    assert response.json()["detail"] == "Dataset parts '5, 6' not found in the database."
+
+
+def test_existing_keywords_and_measured_values(client: TestClient, engine: Engine):
+    with Session(engine) as session:
+        # Populate database
+        session.add_all(
+            [
+                OrmKeyword(name="k1"),
+                OrmMeasuredValue(variable="v1", technique="t1"),
+            ]
+        )
+        session.commit()
+
+    data = {
+        "name": "dset1",
+        "node": "openml",
+        "description": "description",
+        "same_as": "openml.org/1",
+        "node_specific_identifier": "1",
+        "keywords": ["k1", "k2", "k1"],
+        "alternate_names": ["a1", "a2"],
+        "measured_values": [
+            {"variable": "v1", "technique": "t1"},
+            {"variable": "v1", "technique": "t2"},
+        ],
+    }
+    response = client.post("/datasets", json=data)
+    assert response.status_code == 200
+    response_json = response.json()
+    assert sorted(response_json["keywords"]) == ["k1", "k2"]
+    assert set(response_json["alternate_names"]) == {"a1", "a2"}
+    assert response_json["measured_values"] == data["measured_values"]
+    with Session(engine) as session:
+        assert session.query(OrmKeyword).count() == 2
+        assert session.query(OrmMeasuredValue).count() == 2
@@ -157,3 +157,36 @@ def test_null_value(client: TestClient, engine: Engine, field: str):
             "type": "type_error.none.not_allowed",
         }
     ]
+
+
+@pytest.mark.parametrize("value", [None, []])
+def test_empty_lists(client: TestClient, engine: Engine, value):
+    data = {
+        "title": "Title",
+        "body": "b4",
+        "section": "s3",
+        "headline": "h5",
+        "date_modified": "2023-03-21T00:00:00",
+        "word_count": 10,
+    }  # type: typing.Dict[str, typing.Any]
+    for field in ("media", "news_categories", "business_categories", "tags"):
+        data[field] = value
+    response = client.post("/news", json=data)
+    assert response.status_code == 200
+    assert response.json()["title"] == "Title"
+
+
+def test_omitted_lists(client: TestClient, engine: Engine):
+    response = client.post(
+        "/news",
+        json={
+            "title": "Title",
+            "body": "b4",
+            "section": "s3",
+            "headline": "h5",
+            "date_modified": "2023-03-21T00:00:00",
+            "word_count": 10,
+        },
+    )
+    assert response.status_code == 200
+    assert response.json()["title"] == "Title"
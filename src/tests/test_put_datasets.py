@@ -2,10 +2,10 @@ import typing  # noqa:F401 (flake8 raises incorrect 'Module imported but unused'
 
 import pytest
 from sqlalchemy import Engine
-from sqlalchemy.orm import Session
 from starlette.testclient import TestClient
 
 from database.model.dataset import OrmDataset
+from tests.testutils.database import bulk_seed
 
 
 @pytest.mark.parametrize(
@@ -114,23 +114,92 @@ def test_too_long_name(client: TestClient, engine: Engine):
     ]
 
 
+def test_update_related_objects(client: TestClient, engine: Engine):
+    _setup(engine)
+    data = {
+        "name": "dset1",
+        "node": "openml",
+        "description": "",
+        "same_as": "openml.org/1",
+        "node_specific_identifier": "1",
+        "license": "l1",
+        "keywords": ["k1", "k2"],
+        "has_parts": ["2"],
+        "distributions": [{"content_url": "openml.org/1/data", "name": "n1"}],
+    }
+    response = client.put("/datasets/1", json=data)
+    assert response.status_code == 200
+
+    data["license"] = "l2"
+    data["keywords"] = ["k2", "k3"]
+    data["has_parts"] = ["2", "3"]
+    data["distributions"] = [{"content_url": "openml.org/1/data", "name": "n2"}]
+    response = client.put("/datasets/1", json=data)
+    assert response.status_code == 200
+    response_json = response.json()
+    assert response_json["license"] == "l2"
+    assert sorted(response_json["keywords"]) == ["k2", "k3"]
+    assert sorted(response_json["has_parts"]) == ["2", "3"]
+    assert response_json["distributions"] == data["distributions"]
+
+    response = client.get("/datasets/1")
+    assert response.json() == response_json
+
+
+def test_readd_distribution(client: TestClient, engine: Engine):
+    _setup(engine)
+    data = {
+        "name": "dset1",
+        "node": "openml",
+        "description": "",
+        "same_as": "openml.org/1",
+        "node_specific_identifier": "1",
+        "distributions": [{"content_url": "openml.org/1/data"}],
+    }  # type: typing.Dict[str, typing.Any]
+    for distributions in ([{"content_url": "openml.org/1/data"}], [], data["distributions"]):
+        response = client.put("/datasets/1", json=data | {"distributions": distributions})
+        assert response.status_code == 200
+        assert response.json()["distributions"] == distributions
+
+
+def test_duplicated_measured_values(client: TestClient, engine: Engine):
+    _setup(engine)
+    measured_value = {"variable": "v1", "technique": "t1"}
+    data = {
+        "name": "dset1",
+        "node": "openml",
+        "description": "",
+        "same_as": "openml.org/1",
+        "node_specific_identifier": "1",
+        "measured_values": [measured_value, measured_value],
+    }
+    response = client.put("/datasets/1", json=data)
+    assert response.status_code == 200
+    assert response.json()["measured_values"] == [measured_value]
+
+    data["measured_values"] = [{"variable": "v2", "technique": "t2"}]
+    response = client.put("/datasets/1", json=data)
+    assert response.status_code == 200
+    assert response.json()["measured_values"] == data["measured_values"]
+
+
 def _setup(engine):
     datasets = [
-        OrmDataset(
+        dict(
             name="dset1",
             node="openml",
             same_as="openml.org/1",
             description="",
             node_specific_identifier="1",
         ),
-        OrmDataset(
+        dict(
             name="dset1",
             node="other_node",
             same_as="other.org/1",
             description="",
             node_specific_identifier="1",
         ),
-        OrmDataset(
+        dict(
             name="dset2",
             node="other_node",
             same_as="other.org/2",
@@ -138,7 +207,4 @@ def _setup(engine):
             node_specific_identifier="2",
         ),
     ]
-    with Session(engine) as session:
-        # Populate database
-        session.add_all(datasets)
-        session.commit()
+    bulk_seed(engine, OrmDataset.__table__, datasets)
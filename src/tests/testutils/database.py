@@ -0,0 +1,10 @@
+from sqlalchemy import Engine, Table, insert
+
+
+def bulk_seed(engine: Engine, table: Table, rows: list[dict]) -> None:
+    """
+    Populate a table of the test database with a single (executemany) INSERT statement, instead
+    of the separate INSERT per instance that is emitted by Session.add_all.
+    """
+    with engine.begin() as connection:
+        connection.execute(insert(table), rows)